@@ -1,12 +1,42 @@
-from typing import Any, Dict, List, Optional
+import threading
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from agentforge.llm import LLM
 from agentforge.utils.Logger import Logger
 from .config import Config
 from agentforge.utils.PromptHandling import PromptHandling
 
+_storage_lock = threading.Lock()
+_prefetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='AgentPrefetch')
+
+
+@lru_cache(maxsize=None)
+def _storage_utils(persona_name: str):
+    """
+    Returns the storage instance shared by every agent using the given persona, creating it on first use.
+    See ChromaUtils.synchronized for how concurrent use is handled.
+
+    Notes:
+        - Call _storage_utils.cache_clear() to force a fresh storage instance, e.g. between tests.
+    """
+    from .utils.ChromaUtils import ChromaUtils
+    return ChromaUtils(persona_name)
+
+
+def _clean_response(response: Optional[str]) -> Optional[str]:
+    """
+    Trims surrounding whitespace from a model response. str.strip returns the response itself when there is
+    nothing to trim, so already-trimmed responses are not copied. Adapters return None when generation fails.
+    """
+    return response.strip() if response is not None else None
 
 
 class Agent:
+    # Set to True in custom agents that implement prefetch_from_storage
+    prefetch_enabled: bool = False
+
     def __init__(self):
         """
         Initializes an Agent instance, setting up its name, logger, data attributes, and agent-specific configurations.
@@ -22,6 +52,10 @@ class Agent:
         self.result: Optional[str] = None
         self.output: Optional[str] = None
 
+        # Rendering plan for the current prompts, rebuilt only when the prompts change between runs
+        self._prompt_plan: Optional[tuple] = None
+        self._prompt_plan_source: Optional[Dict[str, Any]] = None
+
         if not hasattr(self, 'agent_data'):  # Prevent re-initialization
             self.agent_data: Optional[Dict[str, Any]] = None
 
@@ -38,10 +72,11 @@ class Agent:
         """
         try:
             self.logger.log(f"\n{self.agent_name} - Running...", 'info')
-            self.load_data(**kwargs)
-            self.process_data()
-            self.generate_prompt()
+            self.prepare_llm_call(**kwargs)
+            prefetch = _prefetch_executor.submit(self.prefetch_from_storage) if self.prefetch_enabled else None
             self.run_llm()
+            if prefetch is not None:
+                prefetch.result()
             self.parse_result()
             self.save_to_storage()
             self.build_output()
@@ -76,8 +111,7 @@ class Agent:
             **kwargs (Any): Additional keyword arguments to be merged into the agent's data.
         """
         try:
-            for key in kwargs:
-                self.data[key] = kwargs[key]
+            self.data.update(kwargs)
         except Exception as e:
             self.logger.log(f"Error loading kwargs: {e}", 'error')
 
@@ -86,10 +120,11 @@ class Agent:
         Loads the agent's configuration data including parameters and prompts.
         """
         try:
-            self.agent_data = self.config.load_agent_data(self.agent_name).copy()
+            self.agent_data = self.config.load_agent_data(self.agent_name)
+            # Layer per-run changes over the loaded configuration instead of copying it on every run
             self.data.update({
-                'params': self.agent_data.get('params').copy(),
-                'prompts': self.agent_data['prompts'].copy()
+                'params': ChainMap({}, self.agent_data['params']),
+                'prompts': ChainMap({}, self.agent_data['prompts'])
             })
         except Exception as e:
             self.logger.log(f"Error loading agent data: {e}", 'error')
@@ -101,10 +136,9 @@ class Agent:
         if not self.agent_data['settings']['system'].get('PersonasEnabled'):
             return None
 
-        persona = self.agent_data.get('persona', {})
-        if persona:
-            for key in persona:
-                self.data[key.lower()] = persona[key]
+        if persona := self.agent_data.get('persona'):
+            for key, value in persona.items():
+                self.data[key.lower()] = value
 
     def load_from_storage(self) -> None:
         """
@@ -136,8 +170,12 @@ class Agent:
         try:
             prompts = self.data.get('prompts', {})
 
-            self.prompt_handling.check_prompt_format(prompts)
-            rendered_prompts = self.prompt_handling.render_prompts(prompts, self.data)
+            if self._prompt_plan is None or prompts != self._prompt_plan_source:
+                self.prompt_handling.check_prompt_format(prompts)
+                self._prompt_plan = self.prompt_handling.build_prompt_plan(prompts)
+                self._prompt_plan_source = prompts
+
+            rendered_prompts = self.prompt_handling.render_prompt_plan(self._prompt_plan, self.data)
             self.prompt_handling.validate_rendered_prompts(rendered_prompts)
             self.prompt = rendered_prompts  # {'System': '...', 'User': '...'}
         except Exception as e:
@@ -145,15 +183,40 @@ class Agent:
             self.prompt = None
             raise
 
+    def prepare_llm_call(self, **kwargs: Any) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """
+        Runs the agent's workflow up to prompt generation without invoking the language model. Used by run, and by
+        orchestrators that submit the calls of several agents together through run_llm_batch. Any data left over
+        from a previous call is cleared first, so earlier kwargs cannot leak into the new prompts.
+
+        Parameters:
+            **kwargs (Any): Keyword arguments that will form part of the agent's data.
+
+        Returns:
+            Tuple[Dict[str, str], Dict[str, Any]]: The rendered prompts and the parameters for the language model.
+        """
+        self.data = {}
+        self.load_data(**kwargs)
+        self.process_data()
+        self.generate_prompt()
+        return self.prompt, self.get_llm_params()
+
+    def get_llm_params(self) -> Dict[str, Any]:
+        """
+        Returns the parameters passed to the language model, tagged with the agent's name for logging.
+        """
+        params: Dict[str, Any] = self.agent_data.get("params", {})
+        params['agent_name'] = self.agent_name
+        return params
+
     def run_llm(self) -> None:
         """
         Executes the language model generation with the generated prompt(s) and any specified parameters.
         """
         try:
             model: LLM = self.agent_data['llm']
-            params: Dict[str, Any] = self.agent_data.get("params", {})
-            params['agent_name'] = self.agent_name
-            self.result = model.generate_text(self.prompt, **params).strip()
+            params: Dict[str, Any] = self.get_llm_params()
+            self.result = _clean_response(model.generate_text(self.prompt, **params))
         except Exception as e:
             self.logger.log(f"Error running LLM: {e}", 'error')
             self.result = None
@@ -167,8 +230,19 @@ class Agent:
         if not self.agent_data['settings']['system'].get('StorageEnabled'):
             return None
 
-        from .utils.ChromaUtils import ChromaUtils
-        self.agent_data['storage'] = ChromaUtils(self.agent_data['persona']['Name'])
+        with _storage_lock:
+            self.agent_data['storage'] = _storage_utils(self.agent_data['persona']['Name'])
+
+    def prefetch_from_storage(self) -> None:
+        """
+        Placeholder for storage reads needed after the language model responds. Meant to be overridden by custom
+        agents; runs in a background thread during run_llm when 'prefetch_enabled' is set.
+
+        Notes:
+            - The storage instance for an Agent is set at self.agent_data['storage'] (see ChromaUtils.synchronized).
+            - Store any fetched data in self.data; it will be available by the time parse_result runs.
+        """
+        pass
 
     def parse_result(self) -> None:
         """
@@ -194,3 +268,46 @@ class Agent:
         By default, it simply sets the output as the model's response.
         """
         self.output = self.result
+
+
+def run_llm_batch(agents_and_kwargs: List[Tuple[Agent, Dict[str, Any]]]) -> List[Optional[str]]:
+    """
+    Runs the language model calls of several agents together instead of one after the other. Each call gets its
+    own thread in a pool created for the batch, so their network round-trips overlap; keep batches to a size the
+    model provider's rate limits can absorb.
+
+    Parameters:
+        agents_and_kwargs (List[Tuple[Agent, Dict[str, Any]]]): The agents to run, each paired with the keyword
+            arguments that would otherwise be passed to its run method.
+
+    Returns:
+        List[Optional[str]]: The stripped model responses in the same order as the input, or None for any call
+        that failed. Each agent's 'result' is also set, so parse_result, save_to_storage and build_output can
+        follow as in a regular run.
+    """
+    results: List[Optional[str]] = [None] * len(agents_and_kwargs)
+    if not agents_and_kwargs:
+        return results
+
+    calls = []
+    with ThreadPoolExecutor(max_workers=len(agents_and_kwargs), thread_name_prefix='AgentLLMBatch') as executor:
+        for index, (agent, kwargs) in enumerate(agents_and_kwargs):
+            try:
+                prompt, params = agent.prepare_llm_call(**kwargs)
+            except Exception as e:
+                agent.logger.log(f"Error preparing LLM call: {e}", 'error')
+                agent.result = None
+                continue
+
+            future = executor.submit(agent.agent_data['llm'].generate_text, prompt, **params)
+            calls.append((index, agent, future))
+
+        for index, agent, future in calls:
+            try:
+                agent.result = _clean_response(future.result())
+            except Exception as e:
+                agent.logger.log(f"Error running LLM: {e}", 'error')
+                agent.result = None
+            results[index] = agent.result
+
+    return results
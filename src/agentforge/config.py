@@ -69,6 +69,9 @@ class Config:
                 # Placeholders for the data the agent needs which is located in each respective YAML file
                 self.data = {}
 
+                # Parsed YAML files keyed by path, along with the modification time and size they were parsed at
+                self.file_cache = {}
+
                 # Here is where we load the information from the YAML files to their corresponding attributes
                 self.load_all_configurations()
             except Exception as e:
@@ -129,18 +132,28 @@ class Config:
         Returns:
             dict: The configuration dictionary for the specified agent, or None if not found.
         """
+        return self.search_nested_dict(self.data.get('prompts', {}), agent_name)
+
+    @staticmethod
+    def search_nested_dict(nested_dict: dict, target: str):
+        """
+        Recursively searches a nested dictionary for the value stored under a given key.
 
-        def search_nested_dict(nested_dict, target):
-            for key, value in nested_dict.items():
-                if key == target:
-                    return value
-                elif isinstance(value, dict):
-                    result = search_nested_dict(value, target)
-                    if result is not None:
-                        return result
-            return None
+        Parameters:
+            nested_dict (dict): The dictionary to search.
+            target (str): The key to find.
 
-        return search_nested_dict(self.data.get('prompts', {}), agent_name)
+        Returns:
+            The value stored under the key, or None if not found.
+        """
+        for key, value in nested_dict.items():
+            if key == target:
+                return value
+            elif isinstance(value, dict):
+                result = Config.search_nested_dict(value, target)
+                if result is not None:
+                    return result
+        return None
 
     def load_all_configurations(self):
         """
@@ -154,11 +167,46 @@ class Config:
                     nested_dict = self.get_nested_dict(self.data, relative_path.parts)
 
                     file_path = str(subdir_path / file)
-                    data = load_yaml_file(file_path)
+                    data = self.load_cached_yaml_file(file_path)
                     if data:
                         filename_without_ext = os.path.splitext(file)[0]
                         nested_dict[filename_without_ext] = data
 
+    def load_cached_yaml_file(self, file_path: str):
+        """
+        Loads a YAML file, reusing the previously parsed contents if the file's modification time (in nanoseconds)
+        and size are unchanged since it was last parsed.
+
+        Notes:
+            - Reused contents are the same dict objects as before, so runtime changes made to them persist across
+              reloads until the file itself changes.
+
+        Parameters:
+            file_path (str): The path to the YAML file to be read.
+
+        Returns:
+            dict: The contents of the YAML file as a dictionary.
+        """
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return load_yaml_file(file_path)
+
+        file_signature = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached = self.file_cache.get(file_path)
+        if cached is not None and cached[0] == file_signature:
+            return cached[1]
+
+        data = load_yaml_file(file_path)
+        self.file_cache[file_path] = (file_signature, data)
+        return data
+
+    def invalidate_cache(self):
+        """
+        Clears the parsed YAML file cache, forcing every file to be re-read on the next configuration load.
+        """
+        self.file_cache.clear()
+
     def find_file_in_directory(self, directory: str, filename: str):
         """
         Recursively searches for a file within a directory and its subdirectories.
@@ -77,12 +77,14 @@ class Actions:
         data = self.config.data[collection_name.lower()]
         ids = id_generator(data)
 
-        for (key, value), act_id in zip(data.items(), ids):
+        # Build the item list, descriptions and metadata in a single pass over the data
+        description = []
+        metadata = []
+        for value, act_id in zip(data.values(), ids):
             value['ID'] = act_id
             item_list[value['Name']] = value
-
-        description = [value['Description'] for value in item_list.values()]
-        metadata = [{'Name': key} for key, value in item_list.items()]
+            description.append(value['Description'])
+            metadata.append({'Name': value['Name']})
 
         # Save the item into the selected collection
         self.storage.save_memory(collection_name=collection_name, data=description, ids=ids, metadata=metadata)
@@ -73,7 +73,7 @@ def chunk_save(chunks, url):
     Save chunks of text to memory.
 
     This function processes each chunk of text, removes extra newlines,
-    and saves it to memory using the ChromaUtils instance.
+    and saves all chunks to memory in one call using the ChromaUtils instance.
 
     Args:
         chunks (list): A list of text chunks to save.
@@ -88,10 +88,14 @@ def chunk_save(chunks, url):
     if not isinstance(url, str):
         raise ValueError("URL must be a string")
 
+    if not chunks:
+        return
+
     try:
-        for chunk in chunks:
-            chunk = remove_extra_newlines(chunk)
-            storage_instance.save_memory(collection_name='Results', data=[chunk], metadata=[{"source_url": url}])
+        # Save every chunk in a single call rather than one storage round-trip per chunk
+        data = [remove_extra_newlines(chunk) for chunk in chunks]
+        metadata = [{"source_url": url} for _ in data]
+        storage_instance.save_memory(collection_name='Results', data=data, metadata=metadata)
     except Exception as e:
         raise Exception(f"Error saving chunks to memory: {str(e)}")
 
@@ -1,5 +1,7 @@
 import os
+import threading
 import uuid
+from functools import wraps
 # from pathlib import Path
 from datetime import datetime
 from typing import Optional, Union
@@ -17,6 +19,21 @@ logger = Logger(name="Chroma Utils")
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
 
 
+def synchronized(method):
+    """
+    Serializes calls to a ChromaUtils method on its instance lock. Methods first select a collection into
+    self.collection and then operate on it, so concurrent calls on a shared instance would otherwise race on
+    the selected collection. Callers sharing an instance across threads should go through these methods rather
+    than using self.collection directly.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 def validate_inputs(collection_name: str, data: Union[list, str], ids: list, metadata: list[dict]):
     """
     Validates the inputs for the save_memory method.
@@ -55,7 +72,11 @@ def generate_defaults(data: Union[list, str], ids: list = None, metadata: list[d
     if isinstance(data, str):
         data = [data]
 
-    ids = [str(uuid.uuid4()) for _ in data] if ids is None else ids
+    if ids is None:
+        # Draw the random bytes for every ID in a single call instead of one urandom read per document
+        raw = os.urandom(16 * len(data))
+        ids = [str(uuid.UUID(bytes=raw[i * 16:(i + 1) * 16], version=4)) for i in range(len(data))]
+
     metadata = [{} for _ in data] if metadata is None else metadata
 
     return ids, metadata
@@ -122,6 +143,7 @@ class ChromaUtils:
         """
         self.persona_name = persona_name
         self.config = Config()
+        self.lock = threading.RLock()
         self.init_embeddings()
         self.init_storage()
 
@@ -201,6 +223,7 @@ class ChromaUtils:
 
         return db_path, db_embed
 
+    @synchronized
     def select_collection(self, collection_name: str):
         """
         Selects (or creates if not existent) a collection within the storage by name.
@@ -239,6 +262,7 @@ class ChromaUtils:
         """
         return self.client.list_collections()
 
+    @synchronized
     def peek(self, collection_name: str):
         """
         Peeks into a collection to retrieve a brief overview of its contents.
@@ -265,6 +289,7 @@ class ChromaUtils:
             logger.log(f"Error peeking collection: {e}", 'error')
             return None
 
+    @synchronized
     def load_collection(self, collection_name: str, include: dict = None, where: dict = None, where_doc: dict = None):
         """
         Loads data from a specified collection based on provided filters.
@@ -293,16 +318,13 @@ class ChromaUtils:
         try:
             self.select_collection(collection_name)
             data = self.collection.get(**params)
-            logger.log(
-                f"\nCollection: {collection_name}"
-                f"\nData: {data}",
-                'debug'
-            )
+            logger.logf("\nCollection: %s\nData: %s", 'debug', collection_name, data)
         except Exception as e:
             print(f"\n\nError loading data: {e}")
             data = []
         return data
 
+    @synchronized
     def save_memory(self, collection_name: str, data: Union[list, str], ids: list = None, metadata: list[dict] = None):
         """
         Saves data to memory, creating or updating documents in a specified collection.
@@ -342,6 +364,7 @@ class ChromaUtils:
         except Exception as e:
             raise ValueError(f"Error saving results. Error: {e}\n\nData:\n{data}")
 
+    @synchronized
     def query_memory(self, collection_name: str, query: Optional[Union[str, list]] = None,
                      filter_condition: Optional[dict] = None, include: Optional[list] = None,
                      embeddings: Optional[list] = None, num_results: int = 1):
@@ -484,6 +507,7 @@ class ChromaUtils:
         """
         return self.embedding([text_to_embed])
 
+    @synchronized
     def count_collection(self, collection_name: str):
         """
         Counts the number of documents in a specified collection.
@@ -497,6 +521,7 @@ class ChromaUtils:
         self.select_collection(collection_name)
         return self.collection.count()
 
+    @synchronized
     def search_metadata_min_max(self, collection_name, metadata_tag, min_max):
         """
         Retrieves the collection entry with the minimum or maximum value for the specified metadata tag.
@@ -548,10 +573,8 @@ class ChromaUtils:
                     "document": target_entry["documents"][0],
                 }
 
-                logger.log(
-                    f"Found the following record by max value of {metadata_tag} metadata tag:\n{max_metadata}",
-                    'debug'
-                )
+                logger.logf("Found the following record by max value of %s metadata tag:\n%s", 'debug',
+                           metadata_tag, max_metadata)
                 return max_metadata
             except:
                 return None
@@ -560,10 +583,12 @@ class ChromaUtils:
             logger.log(f"Error finding max metadata: {e}\nCollection: {collection_name}\nTarget Metadata: {metadata_tag}", 'error')
             return None
 
+    @synchronized
     def delete_memory(self, collection_name, doc_id):
         self.select_collection(collection_name)
         self.collection.delete(ids=[doc_id])
 
+    @synchronized
     def rerank_results(self, query_results: dict, query: str, temp_collection_name: str, num_results: int = None):
         """
         Reranks the query results using a temporary collection.
@@ -21,12 +21,22 @@ class BaseLogger:
     Attributes:
         file_handlers (dict): A class-level dictionary tracking file handlers by log file name.
         console_handlers (dict): A class-level dictionary tracking console handlers by logger name.
+        level_codes (dict): A class-level mapping of log level names to logging module level codes.
     """
 
     # Class-level dictionaries to track existing handlers
     file_handlers = {}
     console_handlers = {}
 
+    # Mapping of log level names to logging module level codes
+    level_codes = {
+        'debug': logging.DEBUG,
+        'info': logging.INFO,
+        'warning': logging.WARNING,
+        'error': logging.ERROR,
+        'critical': logging.CRITICAL,
+    }
+
     def __init__(self, name='BaseLogger', log_file='default.log', log_level='error'):
         """
         Initializes the BaseLogger with optional name, log file, and log level.
@@ -67,14 +77,7 @@ class BaseLogger:
         Returns:
             int: The logging module level code corresponding to the provided string.
         """
-        level_dict = {
-            'debug': logging.DEBUG,
-            'info': logging.INFO,
-            'warning': logging.WARNING,
-            'error': logging.ERROR,
-            'critical': logging.CRITICAL,
-        }
-        return level_dict.get(level.lower(), logging.INFO)
+        return BaseLogger.level_codes.get(level.lower(), logging.INFO)
 
     def _setup_console_handler(self, level):
         """
@@ -157,32 +160,45 @@ class BaseLogger:
             os.makedirs(self.log_folder)
             return
 
-    def log_msg(self, msg, level='info'):
+    def log_msg(self, msg, level='info', *args):
         """
         Logs a message at the specified log level.
 
         Parameters:
-            msg (str): The message to log.
+            msg (str): The message to log. May contain %-style placeholders filled from args.
             level (str): The level at which to log the message (e.g., 'info', 'debug', 'error').
+            *args: Values for the placeholders in msg, only formatted if the message is actually emitted.
         """
         level_code = self._get_level_code(level)
 
         if level_code == logging.DEBUG:
-            self.logger.debug(msg)
+            self.logger.debug(msg, *args)
         elif level_code == logging.INFO:
-            self.logger.info(msg)
+            self.logger.info(msg, *args)
         elif level_code == logging.WARNING:
-            self.logger.warning(msg)
+            self.logger.warning(msg, *args)
         elif level_code == logging.ERROR:
-            self.logger.error(msg)
+            self.logger.error(msg, *args)
             self.logger.exception("Exception Error Occurred!")
         elif level_code == logging.CRITICAL:
-            self.logger.critical(msg)
+            self.logger.critical(msg, *args)
             self.logger.exception("Critical Exception Occurred!")
             raise
         else:
             raise ValueError(f'Invalid log level: {level}')
 
+    def is_enabled_for(self, level):
+        """
+        Checks whether a message at the specified log level would be emitted by this logger.
+
+        Parameters:
+            level (str): The log level to check (e.g., 'info', 'debug', 'error').
+
+        Returns:
+            bool: True if messages at the given level are enabled, False otherwise.
+        """
+        return self.logger.isEnabledFor(self._get_level_code(level))
+
     def set_level(self, level):
         """
         Sets the log level for the logger and its handlers.
@@ -256,14 +272,49 @@ class Logger:
             level (str): The log level (e.g., 'info', 'debug', 'error').
             logger_file (str): The specific logger to use, or 'all' to log to all loggers.
         """
+        self._log(msg, level, logger_file)
+
+    def logf(self, msg: str, level: str = 'info', *args, logger_file: str = 'AgentForge'):
+        """
+        Logs a message with %-style placeholders that are only filled in if the message is actually emitted, so
+        large values (e.g. prompts) cost nothing when the level is disabled.
+
+        Parameters:
+            msg (str): The message to log, with %-style placeholders filled from args.
+            level (str): The log level (e.g., 'info', 'debug', 'error').
+            *args: Values for the placeholders in msg.
+            logger_file (str): Keyword-only. The specific logger to use, or 'all' to log to all loggers.
+        """
+        self._log(msg, level, logger_file, *args)
+
+    def _log(self, msg: str, level: str, logger_file: str, *args):
+        base_logger = self._get_logger(logger_file)
+
+        # Skip building the message when it would be discarded anyway; errors still go through log_msg
+        if BaseLogger._get_level_code(level) < logging.ERROR and not base_logger.is_enabled_for(level):
+            return
+
         # Prepend the caller's module name to the log message
-        msg_with_caller = f'[{self.caller_name}]\n{msg}'
+        caller_name = self.caller_name.replace('%', '%%') if args else self.caller_name
+        msg_with_caller = f'[{caller_name}]\n{msg}'
 
+        base_logger.log_msg(msg_with_caller, level, *args)
+
+    def _get_logger(self, logger_file: str) -> BaseLogger:
+        """
+        Retrieves the BaseLogger instance for a logging file.
+
+        Parameters:
+            logger_file (str): The specific logger to retrieve.
+
+        Raises:
+            ValueError: If the logger file is not configured in system.yaml.
+        """
         if logger_file not in self.loggers:
             raise ValueError(f"Unknown logger file '{logger_file}' - Make sure the file name is a Logging File in "
                              f"the configuration file (system.yaml).")
 
-        self.loggers[logger_file].log_msg(msg_with_caller, level)
+        return self.loggers[logger_file]
 
     def log_prompt(self, model_prompt: dict[str]):
         """
@@ -272,14 +323,12 @@ class Logger:
         Parameters:
             model_prompt (dict[str]): A dictionary containing the model prompts for generating a completion.
         """
-        system_prompt = model_prompt.get('System')
-        user_prompt = model_prompt.get('User')
         msg = (
-            f'******\nSystem Prompt\n******\n{system_prompt}\n'
-            f'******\nUser Prompt\n******\n{user_prompt}\n'
-            f'******'
+            '******\nSystem Prompt\n******\n%s\n'
+            '******\nUser Prompt\n******\n%s\n'
+            '******'
         )
-        self.log(msg, 'debug', 'ModelIO')
+        self.logf(msg, 'debug', model_prompt.get('System'), model_prompt.get('User'), logger_file='ModelIO')
 
     def log_response(self, response: str):
         """
@@ -288,8 +337,7 @@ class Logger:
         Parameters:
             response (str): The model response to log.
         """
-        msg = f'******\nModel Response\n******\n{response}\n******'
-        self.log(msg, 'debug', 'ModelIO')
+        self.logf('******\nModel Response\n******\n%s\n******', 'debug', response, logger_file='ModelIO')
 
     def parsing_error(self, model_response: str, error: Exception):
         """
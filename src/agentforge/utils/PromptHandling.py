@@ -1,6 +1,105 @@
 import re
+from functools import lru_cache
 from agentforge.utils.Logger import Logger
 
+# Define a pattern to find all occurrences of {variable_name}
+_variable_pattern = re.compile(r"\{([a-zA-Z_][a-zA-Z0-9_]*)\}")
+# Define a pattern to find all occurrences of escaped braces /{.../}
+_escaped_braces_pattern = re.compile(r'/\{(.*?)/}')
+
+
+class CompiledTemplate:
+    """
+    A prompt template pre-split into literal text and variable names, so that it can be rendered repeatedly
+    without scanning the template again. The parts are also compiled into a specialized render function made of a
+    single straight-line join, avoiding the per-part loop on every render.
+
+    Attributes:
+        template (str): The original prompt template.
+        parts (tuple): A tuple of (literal, variable_name) pairs; variable_name is None for the trailing literal.
+        variables (tuple): The variable names found in the template, in order of appearance.
+    """
+
+    def __init__(self, template: str):
+        """
+        Parses the template into its literal and variable parts.
+
+        Parameters:
+            template (str): The prompt template containing variables within curly braces.
+        """
+        self.template = template
+
+        parts = []
+        position = 0
+        for match in _variable_pattern.finditer(template):
+            parts.append((template[position:match.start()], match.group(1)))
+            position = match.end()
+        parts.append((template[position:], None))
+
+        self.parts = tuple(parts)
+        self.variables = tuple(name for _, name in self.parts if name is not None)
+        self._render_parts = self._build_renderer(self.parts)
+
+    @staticmethod
+    def _build_renderer(parts: tuple):
+        """
+        Generates a function that joins the literal parts with the values of the variables, with every part
+        written out in place.
+
+        Parameters:
+            parts (tuple): The (literal, variable_name) pairs of the template.
+
+        Returns:
+            Callable[[dict], str]: A function rendering the parts from a data dictionary.
+        """
+        # Literals and names are embedded through repr(), and variable names are restricted to identifiers by
+        # the variable pattern, so the generated source cannot contain anything but string constants
+        expressions = []
+        for literal, name in parts:
+            if literal:
+                expressions.append(repr(literal))
+            if name is not None:
+                expressions.append(f"str(get({name!r}, {('{' + name + '}')!r}))")
+
+        source = (
+            "def render(data):\n"
+            "    get = data.get\n"
+            f"    return ''.join([{', '.join(expressions)}])\n"
+        )
+        namespace = {}
+        exec(compile(source, '<prompt template>', 'exec'), {'str': str}, namespace)
+        return namespace['render']
+
+    def render(self, data: dict) -> str:
+        """
+        Renders the template by replacing each variable with its value from the provided data. Variables missing
+        from the data are left as-is, and escaped braces are unescaped afterwards.
+
+        Parameters:
+            data (dict): The data dictionary containing values for the variables in the template.
+
+        Returns:
+            str: The rendered template.
+        """
+        prompt = self._render_parts(data)
+        if '/{' in prompt:
+            prompt = _escaped_braces_pattern.sub(r'{\1}', prompt)
+        return prompt
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template: str) -> CompiledTemplate:
+    """
+    Compiles and caches a prompt template, so templates rendered on every agent run are only parsed once.
+
+    Parameters:
+        template (str): The prompt template containing variables within curly braces.
+
+    Returns:
+        CompiledTemplate: The compiled template.
+    """
+    return CompiledTemplate(template)
+
 
 class PromptHandling:
     """
@@ -10,10 +109,14 @@ class PromptHandling:
     Attributes:
         pattern (str): A regular expression pattern to find all occurrences of variables within curly braces
         in templates.
+        prompt_types (tuple): The prompt types an agent's prompts must define, in the order they are rendered.
     """
 
     # Define a pattern to find all occurrences of {variable_name}
-    pattern = r"\{([a-zA-Z_][a-zA-Z0-9_]*)\}"
+    pattern = _variable_pattern.pattern
+
+    # Define the prompt types every agent prompt file must contain
+    prompt_types = ('System', 'User')
 
     def __init__(self):
         """
@@ -29,20 +132,21 @@ class PromptHandling:
             prompts (dict): The dictionary containing the prompts.
 
         Raises:
-            ValueError: If the prompts do not contain only 'System' and 'User' keys,
-                        or if the sub-prompts are not dictionaries.
+            ValueError: If the prompts do not contain only the keys listed in prompt_types ('System' and 'User'
+                        by default), or if the sub-prompts are not dictionaries.
         """
-        # Check if 'System' and 'User' are the only keys present
-        if set(prompts.keys()) != {'System', 'User'}:
+        # Check if the prompt types are the only keys present
+        if set(prompts.keys()) != set(self.prompt_types):
+            expected_keys = ' and '.join(f"'{prompt_type}'" for prompt_type in self.prompt_types)
             error_message = (
-                "Error: Prompts should contain only 'System' and 'User' keys. "
+                f"Error: Prompts should contain only {expected_keys} keys. "
                 "Please check the prompt YAML file format."
             )
             self.logger.log(error_message, 'error')
             raise ValueError(error_message)
 
-        # Allow 'System' and 'User' prompts to be either dicts or strings
-        for prompt_type in ['System', 'User']:
+        # Allow each prompt type to be either a dict or a string
+        for prompt_type in self.prompt_types:
             prompt_value = prompts.get(prompt_type, {})
             if not isinstance(prompt_value, (dict, str)):
                 error_message = (
@@ -65,7 +169,7 @@ class PromptHandling:
             Exception: Logs an error message and raises an exception if an error occurs during the extraction process.
         """
         try:
-            return re.findall(self.pattern, template)
+            return list(_compile_template(template).variables)
         except Exception as e:
             error_message = f"Error extracting prompt variables: {e}"
             self.logger.log(error_message, 'error')
@@ -87,7 +191,7 @@ class PromptHandling:
             Exception: Logs an error message and raises an exception if an error occurs during the process.
         """
         try:
-            required_vars = self.extract_prompt_variables(prompt_template)
+            required_vars = _compile_template(prompt_template).variables
 
             if not required_vars:
                 return prompt_template
@@ -115,67 +219,99 @@ class PromptHandling:
             Exception: Logs an error message and raises an exception if an error occurs during the rendering process.
         """
         try:
-            def replacement_function(match):
-                variable_name = match.group(1)
-                result = data.get(variable_name, match.group(0))
-                return str(result)
-
-            variable_pattern = re.compile(self.pattern)
-            # First, perform variable substitution
-            prompt = variable_pattern.sub(replacement_function, template)
-
-            # Then, unescape any escaped braces
-            prompt = self.unescape_braces(prompt)
-
-            return prompt
+            return _compile_template(template).render(data)
         except Exception as e:
             error_message = f"Error rendering prompt template: {e}"
             self.logger.log(error_message, 'error')
             raise Exception(error_message)
 
-    def render_prompts(self, prompts, data):
+    def build_prompt_plan(self, prompts):
         """
-        Renders the 'System' and 'User' prompts separately.
+        Flattens the 'System' and 'User' prompts into a reusable rendering plan, so that the section layout and the
+        variables required by each section are only worked out once for a given set of prompts.
 
         Parameters:
             prompts (dict): The dictionary containing 'System' and 'User' prompts.
-            data (dict): The data dictionary containing values for the variables.
 
         Returns:
-            dict: A dictionary containing the rendered 'System' and 'User' prompts.
+            tuple: A tuple of (prompt_type, sections) pairs, where sections is a tuple of
+            (prompt_name, compiled_template, required_vars) entries and required_vars is a frozenset.
 
         Raises:
-            Exception: Logs an error message and raises an exception if an error occurs during prompt rendering.
+            Exception: Logs an error message and raises an exception if an error occurs while building the plan.
         """
         try:
-            rendered_prompts = {}
-            for prompt_type in ['System', 'User']:
-                rendered_sections = []
+            plan = []
+            for prompt_type in self.prompt_types:
                 prompt_content = prompts.get(prompt_type, {})
                 if isinstance(prompt_content, str):
                     prompt_sections = {'Main': prompt_content}
                 else:
                     prompt_sections = prompt_content
 
+                # Freeze each section's variables into a set so repeated placeholders are only checked once
+                sections = []
                 for prompt_name, prompt_template in prompt_sections.items():
-                    template = self.handle_prompt_template(prompt_template, data)
-                    if template:
-                        rendered_prompt = self.render_prompt_template(template, data)
-                        rendered_sections.append(rendered_prompt)
+                    compiled = _compile_template(prompt_template)
+                    sections.append((prompt_name, compiled, frozenset(compiled.variables)))
+                plan.append((prompt_type, tuple(sections)))
+            return tuple(plan)
+        except Exception as e:
+            error_message = f"Error building prompt plan: {e}"
+            self.logger.log(error_message, 'error')
+            raise Exception(error_message)
+
+    def render_prompt_plan(self, plan, data):
+        """
+        Renders a plan built by build_prompt_plan, skipping any section whose variables are missing or empty.
+
+        Parameters:
+            plan (tuple): The rendering plan returned by build_prompt_plan.
+            data (dict): The data dictionary containing values for the variables.
+
+        Returns:
+            dict: A dictionary containing the rendered 'System' and 'User' prompts.
+
+        Raises:
+            Exception: Logs an error message and raises an exception if an error occurs during prompt rendering.
+        """
+        try:
+            rendered_prompts = {}
+            for prompt_type, sections in plan:
+                rendered_sections = []
+                for prompt_name, compiled_template, required_vars in sections:
+                    # Empty sections (e.g. null entries in the prompt YAML) are skipped like sections missing data
+                    if compiled_template.template and all(data.get(var) for var in required_vars):
+                        rendered_sections.append(compiled_template.render(data))
                     else:
                         self.logger.log(
                             f"Skipping '{prompt_name}' in '{prompt_type}' prompt due to missing variables.",
                             'info'
                         )
                 # Join the rendered sections into a single string for each prompt type
-                final_prompt = '\n'.join(rendered_sections)
-                rendered_prompts[prompt_type] = final_prompt
+                rendered_prompts[prompt_type] = '\n'.join(rendered_sections)
             return rendered_prompts
         except Exception as e:
             error_message = f"Error rendering prompts: {e}"
             self.logger.log(error_message, 'error')
             raise Exception(error_message)
 
+    def render_prompts(self, prompts, data):
+        """
+        Renders the 'System' and 'User' prompts separately.
+
+        Parameters:
+            prompts (dict): The dictionary containing 'System' and 'User' prompts.
+            data (dict): The data dictionary containing values for the variables.
+
+        Returns:
+            dict: A dictionary containing the rendered 'System' and 'User' prompts.
+
+        Raises:
+            Exception: Logs an error message and raises an exception if an error occurs during prompt rendering.
+        """
+        return self.render_prompt_plan(self.build_prompt_plan(prompts), data)
+
     def validate_rendered_prompts(self, rendered_prompts):
         """
         Validates the rendered prompts to ensure none are empty.
@@ -206,4 +342,4 @@ class PromptHandling:
         Returns:
             str: The template with escaped braces unescaped.
         """
-        return re.sub(r'/\{(.*?)/}', r'{\1}', template)
+        return _escaped_braces_pattern.sub(r'{\1}', template)